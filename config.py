@@ -2,6 +2,39 @@
 Configuration settings for the web scraper.
 """
 
+__all__ = [
+    'BASE_URL',
+    'LISTING_URL',
+    'REQUEST_HEADERS',
+    'REQUEST_TIMEOUT',
+    'DELAY_BETWEEN_REQUESTS',
+    'MAX_RETRIES',
+    'BACKOFF_STATUS_CODES',
+    'RETRY_JITTER',
+    'MAX_CONCURRENT_REQUESTS',
+    'REQUESTS_PER_SECOND',
+    'REQUEST_BURST',
+    'PARSE_WORKERS',
+    'DEFAULT_MAX_PAGES',
+    'REFRESH_SAVED_LISTINGS',
+    'HTML_CACHE_DIR',
+    'HTML_CACHE_TTL',
+    'INDEX_CACHE_TTL',
+    'SELECTORS',
+    'LABEL_MAPPING',
+    'LOGGING_CONFIG',
+    'OUTPUT_DIRECTORY',
+    'CSV_FILENAME',
+    'PARQUET_FILENAME',
+    'PARQUET_ROW_GROUP_SIZE',
+    'LISTING_QUEUE_SIZE',
+    'PROGRESS_DB_FILENAME',
+    'SCRAPER_STATE_FILENAME',
+    'PROGRESS_BATCH_SIZE',
+    'DB_BATCH_SIZE',
+    'SCRAPER_FLUSH_BATCH',
+]
+
 # Base URLs
 BASE_URL = "https://turbo.az/autos"
 LISTING_URL = f"{BASE_URL}"  # For individual listing pages
@@ -11,7 +44,7 @@ REQUEST_HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
     'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
     'Accept-Language': 'en-US,en;q=0.5',
-    'Connection': 'keep-alive',
+    'Accept-Encoding': 'gzip, deflate, br',  # br is decoded by httpx when brotli is installed
     'Upgrade-Insecure-Requests': '1',
     'Sec-Fetch-Dest': 'document',
     'Sec-Fetch-Mode': 'navigate',
@@ -25,7 +58,19 @@ REQUEST_TIMEOUT = 10  # seconds
 # Scraping Settings
 DELAY_BETWEEN_REQUESTS = 1  # seconds
 MAX_RETRIES = 3
+BACKOFF_STATUS_CODES = (429, 502, 503, 504)  # Retried with exponential backoff
+RETRY_JITTER = 0.5  # seconds of random delay added to each backoff
+MAX_CONCURRENT_REQUESTS = 64  # Upper bound on requests in flight at once
+REQUESTS_PER_SECOND = 10  # Token-bucket refill rate; server rate-limit headers can lower it
+REQUEST_BURST = 20  # Requests allowed back-to-back before pacing kicks in
+PARSE_WORKERS = None  # Processes used to parse listing HTML; None uses every CPU core
 DEFAULT_MAX_PAGES = None  # Set to None to scrape all pages, or a number to limit pages
+REFRESH_SAVED_LISTINGS = True  # Re-fetch listings already in the database so their price is updated
+
+# HTML Cache Settings
+HTML_CACHE_DIR = "cache"
+HTML_CACHE_TTL = 3600  # seconds a cached page is served without revalidation; 0 always revalidates
+INDEX_CACHE_TTL = 60  # search-result pages change often, so they go stale sooner
 
 # HTML Selectors
 SELECTORS = {
@@ -38,7 +83,10 @@ SELECTORS = {
     'price': 'div.product-price__i',
     'title': 'h1.product-title',
     'description': 'div.product-description',
-    'shop_contact': 'div.shop-contact'
+    'shop_contact': 'div.shop-contact',
+    'owner_info': 'div.product-owner__info',
+    'images': 'div.product-photos__img img',
+    'pagination': 'div.pagination'
 }
 
 # Label Mappings (Azerbaijani to English)
@@ -85,6 +133,9 @@ LOGGING_CONFIG = {
         '': {  # Root logger
             'handlers': ['console', 'file'],
             'level': 'INFO',
+        },
+        'httpx': {  # Logs every request at INFO; only surface problems
+            'level': 'WARNING',
         }
     }
 }
@@ -92,3 +143,11 @@ LOGGING_CONFIG = {
 # Output Settings
 OUTPUT_DIRECTORY = "data"
 CSV_FILENAME = "turbo_az_listings.csv"
+PARQUET_FILENAME = "turbo_az_listings.parquet"
+PARQUET_ROW_GROUP_SIZE = 5000  # Listings buffered per Parquet row group
+LISTING_QUEUE_SIZE = 1000  # Scraped listings waiting for the writer before producers block
+PROGRESS_DB_FILENAME = "progress.db"  # SQLite checkpoint used to resume interrupted runs
+SCRAPER_STATE_FILENAME = "scraper_state.json"  # TurboAzScraper's resume checkpoint
+PROGRESS_BATCH_SIZE = 1000  # Listings per checkpoint transaction
+DB_BATCH_SIZE = 1000  # Listings per bulk insert into the cars table
+SCRAPER_FLUSH_BATCH = 500  # Listings TurboAzScraper buffers before saving to the database and CSV
@@ -0,0 +1,82 @@
+"""
+Content-addressable on-disk cache for fetched HTML pages.
+"""
+import gzip
+import hashlib
+import json
+import os
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+
+@dataclass
+class CachedPage:
+    """A cached page body plus the validators needed for a conditional GET."""
+    html: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+
+    def is_fresh(self, ttl: float) -> bool:
+        """Whether the page is young enough to be served without asking the server."""
+        return time.time() - self.fetched_at < ttl
+
+    def validators(self) -> Dict[str, str]:
+        """Request headers that let the server answer 304 Not Modified."""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class HTMLCache:
+    """Stores pages as ``<dir>/<key[:2]>/<key>.html.gz`` where ``key`` is the SHA-256 of the URL."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def _paths(self, url: str) -> Tuple[str, str]:
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        base = os.path.join(self.directory, key[:2], key)
+        return base + '.html.gz', base + '.json'
+
+    def get(self, url: str) -> Optional[CachedPage]:
+        """Return the cached page for ``url``, or None on a miss."""
+        body_path, meta_path = self._paths(url)
+        try:
+            with open(meta_path, encoding='utf-8') as f:
+                meta = json.load(f)
+            with gzip.open(body_path, 'rt', encoding='utf-8') as f:
+                html = f.read()
+        except (OSError, ValueError):
+            return None
+        return CachedPage(html, meta.get('etag'), meta.get('last_modified'), meta.get('fetched_at', 0.0))
+
+    def put(self, url: str, html: str, etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+        """Store a freshly downloaded page."""
+        body_path, _ = self._paths(url)
+        os.makedirs(os.path.dirname(body_path), exist_ok=True)
+        _atomic_write(body_path, gzip.compress(html.encode('utf-8'), compresslevel=6))
+        self._write_meta(url, etag, last_modified)
+
+    def touch(self, url: str) -> None:
+        """Mark a cached page as revalidated (the server answered 304)."""
+        cached = self.get(url)
+        if cached:
+            self._write_meta(url, cached.etag, cached.last_modified)
+
+    def _write_meta(self, url: str, etag: Optional[str], last_modified: Optional[str]) -> None:
+        _, meta_path = self._paths(url)
+        meta = {'url': url, 'etag': etag, 'last_modified': last_modified, 'fetched_at': time.time()}
+        _atomic_write(meta_path, json.dumps(meta).encode('utf-8'))
+
+
+def _atomic_write(path: str, data: bytes) -> None:
+    """Write via a temporary file so readers never see a partial entry."""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
@@ -1,64 +1,90 @@
 import pandas as pd
-from models import init_db, Car, save_car_to_db
+import pyarrow.parquet as pq
+from models import init_db, engine, Car, car_upsert_statement
+from config import OUTPUT_DIRECTORY, CSV_FILENAME, PARQUET_FILENAME
+from datetime import datetime
 import logging
 import os
+import sys
+from typing import Iterator
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def import_csv_to_db(csv_path: str):
-    """Import CSV data into the database."""
+# Rows read from the data file per chunk, and rows per multi-value INSERT statement
+READ_CHUNK_SIZE = 50_000
+INSERT_CHUNK_SIZE = 1000
+
+FLOAT_COLUMNS = ['price', 'engine_size', 'mileage']
+
+# Low-cardinality text columns are read as categoricals to keep each chunk small
+CATEGORY_COLUMNS = ['brand', 'model', 'body_type', 'color', 'transmission', 'fuel_type']
+CSV_DTYPES = {'listing_id': 'string', **{col: 'category' for col in CATEGORY_COLUMNS}}
+
+def iter_chunks(path: str) -> Iterator[pd.DataFrame]:
+    """Stream a Parquet (or legacy CSV) file in fixed-size chunks, yielding each one cleaned and ready to insert."""
+    if path.endswith('.parquet'):
+        # Parquet keeps column dtypes, so only the missing values need filling below
+        raw_chunks = (
+            batch.to_pandas(categories=CATEGORY_COLUMNS)
+            for batch in pq.ParquetFile(path).iter_batches(batch_size=READ_CHUNK_SIZE)
+        )
+    else:
+        raw_chunks = pd.read_csv(path, chunksize=READ_CHUNK_SIZE, low_memory=True, dtype=CSV_DTYPES)
+
+    for chunk in raw_chunks:
+        # listing_id is unique in the table; keep the latest row like the old upsert did
+        chunk = chunk.drop_duplicates('listing_id', keep='last')
+
+        # Coerce whole columns at once; unparseable or missing values become 0
+        chunk[FLOAT_COLUMNS] = chunk[FLOAT_COLUMNS].apply(pd.to_numeric, errors='coerce').fillna(0.0)
+        chunk['year'] = pd.to_numeric(chunk['year'], errors='coerce').fillna(0).astype('int32')
+
+        # to_sql bypasses the ORM, so set the timestamp defaults here
+        now = datetime.utcnow()
+        chunk['created_at'] = now
+        chunk['updated_at'] = now
+
+        yield chunk
+
+def _upsert_rows(table, conn, keys, data_iter):
+    """to_sql insert method that updates listings already in the table."""
+    conn.execute(car_upsert_statement(), [dict(zip(keys, row)) for row in data_iter])
+
+def import_to_db(path: str):
+    """Import scraped listings into the database."""
     try:
         # Initialize database
         init_db()
         logger.info("Database initialized")
 
-        # Read CSV file
-        df = pd.read_csv(csv_path)
-        logger.info(f"Read {len(df)} records from CSV")
-
-        # Process each row
-        for idx, row in df.iterrows():
-            try:
-                # Create Car instance
-                car = Car(
-                    listing_id=str(row['listing_id']),
-                    title=row['title'],
-                    price=float(row['price']) if pd.notna(row['price']) else 0.0,
-                    description=row['description'],
-                    location=row['location'],
-                    brand=row['brand'],
-                    model=row['model'],
-                    year=int(row['year']) if pd.notna(row['year']) else 0,
-                    body_type=row['body_type'],
-                    color=row['color'],
-                    engine_size=float(row['engine_size']) if pd.notna(row['engine_size']) else 0.0,
-                    mileage=float(row['mileage']) if pd.notna(row['mileage']) else 0.0,
-                    transmission=row['transmission'],
-                    fuel_type=row['fuel_type'],
-                    seller_type=row['seller_type'],
-                    images=row['images'],
-                    url=row['url']
-                )
-                
-                # Save to database
-                save_car_to_db(car)
-                
-                # Show progress
-                if (idx + 1) % 10 == 0:
-                    logger.info(f"Processed {idx + 1} records")
-                
-            except Exception as e:
-                logger.error(f"Error processing row {idx}: {str(e)}")
-                continue
-
-        logger.info("CSV import completed successfully")
+        # The table now persists between runs, so existing listings are updated in place
+        insert_method = _upsert_rows if car_upsert_statement() is not None else 'multi'
+
+        imported = 0
+        for chunk in iter_chunks(path):
+            # One transaction and a handful of multi-row INSERTs per chunk
+            with engine.begin() as conn:
+                chunk.to_sql(Car.__tablename__, conn, if_exists='append', index=False,
+                             method=insert_method, chunksize=INSERT_CHUNK_SIZE)
+
+            imported += len(chunk)
+            logger.info(f"Processed {imported} records")
+
+        logger.info("Import completed successfully")
 
     except Exception as e:
-        logger.error(f"Error importing CSV: {str(e)}")
+        logger.error(f"Error importing {path}: {str(e)}")
         raise
 
+def default_data_path() -> str:
+    """The scraper's Parquet dataset, or the legacy CSV when no Parquet file exists yet."""
+    parquet_path = os.path.join(OUTPUT_DIRECTORY, PARQUET_FILENAME)
+    if os.path.exists(parquet_path):
+        return parquet_path
+    return os.path.join(OUTPUT_DIRECTORY, CSV_FILENAME)
+
 if __name__ == "__main__":
-    csv_path = os.path.join("data", "turbo_az_listings.csv")
-    import_csv_to_db(csv_path)
+    # An explicit path may be given on the command line
+    import_to_db(sys.argv[1] if len(sys.argv) > 1 else default_data_path())
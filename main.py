@@ -1,123 +1,294 @@
-import pandas as pd
-import requests
+import asyncio
+import pyarrow as pa
+import pyarrow.parquet as pq
+import httpx
 import logging
 import logging.config
 import os
-import json
-from time import sleep
-from bs4 import BeautifulSoup
-from typing import List, Dict, Optional
+import orjson
+import random
+import re
+import statistics
+from collections import Counter
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import suppress
+from selectolax.lexbor import LexborHTMLParser
+from typing import List, Dict, Optional, Set
 from datetime import datetime
 
-from models import init_db, Car, save_car_to_db
+from models import init_db, Car, save_car_to_db, save_cars_to_db, get_saved_listing_ids, iter_car_rows
+from rate_limiter import RateLimiter
+from html_cache import HTMLCache
+from progress_store import ProgressStore
 from config import (
     BASE_URL, REQUEST_HEADERS, REQUEST_TIMEOUT, 
-    DELAY_BETWEEN_REQUESTS, MAX_RETRIES,
+    DELAY_BETWEEN_REQUESTS, MAX_RETRIES, BACKOFF_STATUS_CODES, RETRY_JITTER, MAX_CONCURRENT_REQUESTS,
+    REQUESTS_PER_SECOND, REQUEST_BURST, PARSE_WORKERS, HTML_CACHE_DIR, HTML_CACHE_TTL, INDEX_CACHE_TTL,
     SELECTORS, LABEL_MAPPING, LOGGING_CONFIG,
-    OUTPUT_DIRECTORY, CSV_FILENAME, DEFAULT_MAX_PAGES
+    OUTPUT_DIRECTORY, PARQUET_FILENAME, PARQUET_ROW_GROUP_SIZE, LISTING_QUEUE_SIZE,
+    PROGRESS_DB_FILENAME, PROGRESS_BATCH_SIZE, DB_BATCH_SIZE,
+    DEFAULT_MAX_PAGES, REFRESH_SAVED_LISTINGS
 )
 
 # Initialize logging
 logging.config.dictConfig(LOGGING_CONFIG)
 logger = logging.getLogger(__name__)
 
-def fetch_page(url: str) -> Optional[str]:
-    """Fetch page content with retries."""
+# Columns read back from the finished dataset for the end-of-run summary
+SUMMARY_COLUMNS = ['listing_id', 'brand', 'model', 'year', 'price', 'mileage']
+
+# Downloaded pages, keyed by URL, so re-runs skip unchanged pages
+_html_cache = HTMLCache(HTML_CACHE_DIR)
+
+# 4xx statuses worth retrying (timeout, rate limit); any other 4xx is final
+_RETRYABLE_CLIENT_ERRORS = (408, 429)
+
+# CSS selectors resolved once at import time instead of on every query
+_CAR_CONTAINER_CSS = SELECTORS['car_container']
+_PROPERTIES_COLUMN_CSS = SELECTORS['properties_column']
+_PROPERTY_NAME_CSS = SELECTORS['property_name']
+_PROPERTY_VALUE_CSS = SELECTORS['property_value']
+_PRODUCT_LINK_CSS = SELECTORS['product_link']
+_PRICE_CSS = SELECTORS['price']
+_TITLE_CSS = SELECTORS['title']
+_DESCRIPTION_CSS = SELECTORS['description']
+_SHOP_CONTACT_CSS = SELECTORS['shop_contact']
+_IMAGES_CSS = SELECTORS['images']
+_PAGINATION_CSS = SELECTORS['pagination']
+
+# Class names that must appear in a page's raw HTML for it to be worth parsing;
+# a substring check rejects empty or placeholder pages without building a tree
+_PROPERTIES_COLUMN_CLASS = _PROPERTIES_COLUMN_CSS.rsplit('.', 1)[-1]
+_PRODUCT_LINK_CLASS = _PRODUCT_LINK_CSS.rsplit('.', 1)[-1]
+_TITLE_CLASS = _TITLE_CSS.rsplit('.', 1)[-1]
+
+# Every field of a listing page as one selector group, so lexbor walks the
+# document once and returns all matches in document order. Matches are told
+# apart by their class; images are the only <img> tags the group can match.
+_LISTING_FIELDS_CSS = ', '.join([
+    _TITLE_CSS, _PRICE_CSS, _DESCRIPTION_CSS, _PROPERTY_NAME_CSS,
+    _PROPERTY_VALUE_CSS, _SHOP_CONTACT_CSS, _IMAGES_CSS,
+])
+_LISTING_FIELD_BY_CLASS = {
+    css.rsplit('.', 1)[-1]: field
+    for css, field in [
+        (_TITLE_CSS, 'title'),
+        (_PRICE_CSS, 'price'),
+        (_DESCRIPTION_CSS, 'description'),
+        (_PROPERTY_NAME_CSS, 'property_name'),
+        (_PROPERTY_VALUE_CSS, 'property_value'),
+        (_SHOP_CONTACT_CSS, 'shop_contact'),
+    ]
+}
+
+# Every car card's properties on a results page, likewise in one selector group.
+# A container match starts a new car; its column, labels and values follow it.
+_CAR_COLUMN_CSS = f"{_CAR_CONTAINER_CSS} {_PROPERTIES_COLUMN_CSS}"
+_PAGE_CARS_CSS = ', '.join([
+    _CAR_CONTAINER_CSS, _CAR_COLUMN_CSS,
+    f"{_CAR_COLUMN_CSS} {_PROPERTY_NAME_CSS}", f"{_CAR_COLUMN_CSS} {_PROPERTY_VALUE_CSS}",
+])
+_PAGE_FIELD_BY_CLASS = {
+    css.rsplit('.', 1)[-1]: field
+    for css, field in [
+        (_CAR_CONTAINER_CSS, 'container'),
+        (_PROPERTIES_COLUMN_CSS, 'properties_column'),
+        (_PROPERTY_NAME_CSS, 'property_name'),
+        (_PROPERTY_VALUE_CSS, 'property_value'),
+    ]
+}
+
+# Patterns for the numeric fields, compiled once rather than filtering per character
+_NON_DIGIT_RE = re.compile(r'\D+')
+_ENGINE_SIZE_RE = re.compile(r'[\d.]+')
+_NON_NUMBER_RE = re.compile(r'[^\d.]+')
+
+# Fuel names as written in Azerbaijani listings, found in a single regex scan
+_FUEL_TYPES = {
+    'benzin': 'Gasoline',
+    'dizel': 'Diesel',
+    'diesel': 'Diesel',
+    'qaz': 'Gas',
+    'elektro': 'Electric',
+    'hibrid': 'Hybrid'
+}
+_FUEL_RE = re.compile('|'.join(_FUEL_TYPES), re.IGNORECASE)
+# Which name wins when a text mentions several
+_ENGINE_FUEL_PRIORITY = ('hibrid', 'elektro', 'dizel', 'diesel', 'benzin', 'qaz')
+_TITLE_FUEL_PRIORITY = ('benzin', 'dizel', 'qaz', 'elektro', 'hibrid')
+
+def _match_field(node, field_by_class: Dict[str, str]) -> Optional[str]:
+    """Name of the field a node from a selector group matched, judged by its class."""
+    for cls in (node.attributes.get('class') or '').split():
+        field = field_by_class.get(cls)
+        if field:
+            return field
+    return None
+
+# Arrow schema of the listings file, defined once for the whole crawl
+LISTING_SCHEMA = pa.schema([
+    ('title', pa.string()),
+    ('price', pa.float64()),
+    ('description', pa.string()),
+    ('location', pa.string()),
+    ('brand', pa.string()),
+    ('model', pa.string()),
+    ('year', pa.int64()),
+    ('body_type', pa.string()),
+    ('color', pa.string()),
+    ('engine_size', pa.float64()),
+    ('mileage', pa.float64()),
+    ('transmission', pa.string()),
+    ('fuel_type', pa.string()),
+    ('seller_type', pa.string()),
+    ('images', pa.string()),
+    ('url', pa.string()),
+    ('listing_id', pa.string()),
+])
+
+async def fetch_page(client: httpx.AsyncClient, limiter: RateLimiter, url: str,
+                     cache_ttl: float = HTML_CACHE_TTL) -> Optional[str]:
+    """Fetch page content with retries, paced by the shared rate limiter.
+
+    Pages are served from the on-disk HTML cache while younger than
+    ``cache_ttl`` seconds; older entries are revalidated with a conditional GET.
+    Index pages pass INDEX_CACHE_TTL so new listings show up on the next run.
+    """
+    cached = _html_cache.get(url)
+    if cached and cached.is_fresh(cache_ttl):
+        logger.debug(f"Serving {url} from cache")
+        return cached.html
+    
+    conditional_headers = cached.validators() if cached else None
+    
     for attempt in range(MAX_RETRIES):
         try:
-            # Info: Normal operation status
-            logger.info(f"Fetching URL: {url}")
+            # Debug: Per-request detail
+            logger.debug("Fetching URL: %s", url)
             
-            response = requests.get(url, headers=REQUEST_HEADERS, timeout=REQUEST_TIMEOUT)
+            async with limiter:
+                response = await client.get(url, headers=conditional_headers)
             
             # Debug: Detailed information for troubleshooting
-            logger.debug(f"Response headers: {dict(response.headers)}")
+            logger.debug(f"Response headers ({response.http_version}): {dict(response.headers)}")
+            
+            # Let the server's advertised limits steer the shared bucket
+            limiter.update_from_headers(response.headers)
+            
+            status = response.status_code
+            if status == 304 and cached:
+                # Debug: Cached copy is still current
+                logger.debug("Not modified, using cached copy of %s", url)
+                _html_cache.touch(url)
+                return cached.html
+            
+            if status == 200:
+                # Debug: Successful request
+                logger.debug("Successfully fetched %s", url)
+                html = response.text
+                _html_cache.put(url, html, response.headers.get('ETag'), response.headers.get('Last-Modified'))
+                return html
             
-            if response.status_code == 200:
-                # Info: Successful operation
-                logger.info(f"Successfully fetched {url}")
-                return response.text
-            elif response.status_code == 429:
-                # Warning: Rate limiting (important but not fatal)
-                logger.warning(f"Rate limit hit while fetching {url}, waiting before retry")
-                sleep(DELAY_BETWEEN_REQUESTS * 2)
+            if 400 <= status < 500 and status not in _RETRYABLE_CLIENT_ERRORS:
+                # Warning: Removed or forbidden listing; asking again won't change the answer
+                logger.warning(f"Giving up on {url}: status {status}")
+                return None
+            
+            if status in BACKOFF_STATUS_CODES:
+                # Warning: Rate limiting or overload (important but not fatal). A
+                # Retry-After header has already paused the limiter for everyone.
+                logger.warning(f"Got status {status} while fetching {url}, waiting before retry")
             else:
                 # Error: Request failed but we can retry
-                logger.error(f"Failed to fetch {url}, status code: {response.status_code}")
+                logger.error(f"Failed to fetch {url}, status code: {status}")
         
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
             # Warning: Timeout can be temporary
             logger.warning(f"Timeout while fetching {url}, attempt {attempt + 1} of {MAX_RETRIES}")
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             # Error: More serious connection issues
             logger.error(f"Request failed for {url}: {str(e)}")
         
         if attempt < MAX_RETRIES - 1:
-            sleep(DELAY_BETWEEN_REQUESTS)
+            # Exponential backoff; the jitter keeps concurrent retries from firing in lockstep
+            await asyncio.sleep(DELAY_BETWEEN_REQUESTS * 2 ** attempt + random.uniform(0, RETRY_JITTER))
         else:
             # Critical: All retries failed
             logger.critical(f"All attempts to fetch {url} failed after {MAX_RETRIES} retries")
     
     return None
 
-def process_page(url: str) -> pd.DataFrame:
+async def process_page(client: httpx.AsyncClient, limiter: RateLimiter, url: str) -> List[Dict[str, str]]:
     """Process a single page and extract car details."""
     # Info: Starting new operation
     logger.info(f"Processing page: {url}")
     
     all_cars_data = []
-    html = fetch_page(url)
+    html = await fetch_page(client, limiter, url, INDEX_CACHE_TTL)
     
     if not html:
         # Warning: No data but not necessarily an error
         logger.warning(f"No HTML content retrieved for {url}")
-        return pd.DataFrame()
+        return []
+    
+    if _PROPERTIES_COLUMN_CLASS not in html:
+        # Warning: Page has no car properties at all, nothing to parse
+        logger.warning(f"No car properties found on page {url}")
+        return []
 
-    soup = BeautifulSoup(html, 'html.parser')
-    car_containers = soup.find_all(class_=SELECTORS['car_container'].split('.')[-1])
+    # One walk over the page collects every card's property pairs in document order
+    cars = []
+    pending_label = None
+    translate = LABEL_MAPPING.get
+    
+    for node in LexborHTMLParser(html).css(_PAGE_CARS_CSS):
+        field = _match_field(node, _PAGE_FIELD_BY_CLASS)
+        if field == 'container':
+            cars.append(None)
+            pending_label = None
+        elif field == 'properties_column':
+            if cars and cars[-1] is None:
+                cars[-1] = {}
+        elif field == 'property_name':
+            pending_label = node.text().strip()
+        elif field == 'property_value' and cars and cars[-1] is not None:
+            if pending_label is not None:
+                cars[-1][translate(pending_label, pending_label)] = node.text().strip()
+                pending_label = None
     
     # Debug: Detailed processing information
-    logger.debug(f"Found {len(car_containers)} car containers in HTML")
+    logger.debug(f"Found {len(cars)} car containers in HTML")
     
-    if not car_containers:
+    if not cars:
         # Warning: Unexpected but not fatal
         logger.warning(f"No car containers found on page {url}")
 
-    for idx, container in enumerate(car_containers, 1):
-        try:
-            # Debug: Processing progress
-            logger.debug(f"Processing car {idx} of {len(car_containers)}")
-            
-            properties_div = container.find(class_=SELECTORS['properties_column'].split('.')[-1])
-            if properties_div:
-                car_details = parse_car_details(properties_div)
-                all_cars_data.append(car_details)
-            else:
-                # Warning: Missing data for one item
-                logger.warning(f"No properties div found for car {idx}")
-        
-        except Exception as e:
-            # Error: Processing failed for one item
-            logger.error(f"Error processing car {idx}: {str(e)}")
+    for idx, car_details in enumerate(cars, 1):
+        if car_details is None:
+            # Warning: Missing data for one item
+            logger.warning(f"No properties div found for car {idx}")
+        else:
+            all_cars_data.append(car_details)
 
     # Info: Operation completion status
     logger.info(f"Successfully processed {len(all_cars_data)} cars from {url}")
-    return pd.DataFrame(all_cars_data)
+    return all_cars_data
 
-def get_all_listing_ids(page_number: int) -> List[str]:
+async def get_all_listing_ids(client: httpx.AsyncClient, limiter: RateLimiter,
+                              page_number: int) -> List[str]:
     """Get all listing IDs from a specific page."""
     url = f"{BASE_URL}?page={page_number}"
-    html = fetch_page(url)
-    if not html:
+    html = await fetch_page(client, limiter, url, INDEX_CACHE_TTL)
+    if not html or _PRODUCT_LINK_CLASS not in html:
         return []
 
-    soup = BeautifulSoup(html, 'html.parser')
+    tree = LexborHTMLParser(html)
     listing_ids = []
-    product_links = soup.find_all(class_=SELECTORS['product_link'].split('.')[-1])
-    logger.info(f"Found {len(product_links)} product links")
+    product_links = tree.css(_PRODUCT_LINK_CSS)
+    logger.debug("Found %d product links", len(product_links))
 
     for link in product_links:
-        href = link.get('href')
+        href = link.attributes.get('href')
         if href:
             try:
                 listing_id = href.split('/')[2].split('-')[0]
@@ -127,30 +298,14 @@ def get_all_listing_ids(page_number: int) -> List[str]:
 
     return listing_ids
 
-def parse_car_details(soup) -> Dict[str, str]:
-    properties = {}
-    property_items = soup.find_all(class_=SELECTORS['property_item'].split('.')[-1])
-    logger.debug(f"Found {len(property_items)} property items")
-
-    for item in property_items:
-        try:
-            label = item.find(class_=SELECTORS['property_name'].split('.')[-1]).text.strip()
-            value = item.find(class_=SELECTORS['property_value'].split('.')[-1]).text.strip()
-            english_label = LABEL_MAPPING.get(label, label)
-            properties[english_label] = value
-        except Exception as e:
-            logger.error(f"Error parsing property item: {str(e)}")
-
-    return properties
-
 def extract_price(price_text: str) -> float:
     """Extract numeric price value from text."""
     try:
         if not price_text:
             return 0.0
         # Remove currency and spaces, convert to float
-        price = float(''.join(filter(str.isdigit, price_text)))
-        return price
+        digits = _NON_DIGIT_RE.sub('', price_text)
+        return float(digits) if digits else 0.0
     except Exception as e:
         logger.error(f"Error extracting price: {str(e)}")
         return 0.0
@@ -161,8 +316,8 @@ def extract_engine_size(engine_text: str) -> float:
         if not engine_text:
             return 0.0
         # Extract numeric value from string like "1.6 L"
-        engine_size = float(''.join(c for c in engine_text.split()[0] if c.isdigit() or c == '.'))
-        return engine_size
+        match = _ENGINE_SIZE_RE.search(engine_text)
+        return float(match.group()) if match else 0.0
     except Exception as e:
         logger.error(f"Error extracting engine size: {str(e)}")
         return 0.0
@@ -175,33 +330,15 @@ def extract_fuel_type(properties: Dict, title: str) -> str:
         if fuel_type:
             return fuel_type
 
-        # Common fuel types in Azerbaijani
-        fuel_types = {
-            'Benzin': 'Gasoline',
-            'Dizel': 'Diesel',
-            'Qaz': 'Gas',
-            'Elektro': 'Electric',
-            'Hibrid': 'Hybrid'
-        }
-
-        # Try to get from engine_size property which sometimes contains fuel type
-        engine_info = properties.get('engine_size', '').lower()
-        if 'hibrid' in engine_info:
-            return 'Hybrid'
-        elif 'elektro' in engine_info:
-            return 'Electric'
-        elif 'dizel' in engine_info or 'diesel' in engine_info:
-            return 'Diesel'
-        elif 'benzin' in engine_info:
-            return 'Gasoline'
-        elif 'qaz' in engine_info:
-            return 'Gas'
-
-        # Try to extract from title
-        title_lower = title.lower()
-        for az_type, en_type in fuel_types.items():
-            if az_type.lower() in title_lower:
-                return en_type
+        # Try to get from engine_size property which sometimes contains fuel type,
+        # then from the title; each text is scanned once and the names found are
+        # ranked, so e.g. "Benzin/Hibrid" still counts as a hybrid
+        for text, priority in ((properties.get('engine_size', ''), _ENGINE_FUEL_PRIORITY),
+                               (title, _TITLE_FUEL_PRIORITY)):
+            found = {name.lower() for name in _FUEL_RE.findall(text)}
+            for name in priority:
+                if name in found:
+                    return _FUEL_TYPES[name]
 
         # Default to most common fuel type if nothing found
         return 'Gasoline'
@@ -210,62 +347,98 @@ def extract_fuel_type(properties: Dict, title: str) -> str:
         logger.error(f"Error extracting fuel type: {str(e)}")
         return 'Gasoline'  # Default to most common fuel type
 
-def scrape_specific_listing(url: str) -> Dict:
-    """Scrape details from a specific car listing URL."""
-    logger.info(f"Scraping specific listing: {url}")
+def build_car_data(title: str, texts: Dict[str, str], properties: Dict[str, str],
+                   images: List[str], is_dealer: bool, url: str) -> Dict:
+    """Turn the raw strings collected from a listing page into a car row."""
+    get = properties.get
+    return {
+        'title': title,
+        'price': extract_price(texts.get('price')),
+        'description': texts.get('description'),
+        'location': get('location'),
+        'brand': get('brand'),
+        'model': get('model'),
+        'year': int(get('year') or 0),
+        'body_type': get('body_type'),
+        'color': get('color'),
+        'engine_size': extract_engine_size(get('engine_size')),
+        'mileage': float(_NON_NUMBER_RE.sub('', get('mileage') or '') or 0),
+        'transmission': get('transmission'),
+        'fuel_type': extract_fuel_type(properties, title),
+        'seller_type': 'Dealer' if is_dealer else 'Private',
+        'images': orjson.dumps(images).decode() if images else None,
+        'url': url
+    }
+
+def parse_listing(html: str, url: str) -> Dict:
+    """Extract car details from a listing page's HTML.
+
+    Pure and module-level so it can run in a worker process.
+    """
+    tree = LexborHTMLParser(html)
+    
+    # Collect every field from a single pass over the document
+    texts = {}
+    properties = {}
+    images = []
+    is_dealer = False
+    pending_label = None
+    translate = LABEL_MAPPING.get
+    
+    for node in tree.css(_LISTING_FIELDS_CSS):
+        if node.tag == 'img':
+            src = node.attributes.get('src')
+            if src:
+                images.append(src)
+            continue
+        
+        field = _match_field(node, _LISTING_FIELD_BY_CLASS)
+        if field == 'property_name':
+            pending_label = node.text().strip()
+        elif field == 'property_value':
+            # Values follow their label inside the same property item
+            if pending_label is not None:
+                properties[translate(pending_label, pending_label)] = node.text().strip()
+                pending_label = None
+        elif field == 'shop_contact':
+            is_dealer = True
+        elif field and field not in texts:
+            texts[field] = node.text().strip()
+    
+    title = texts.get('title')
+    if not title:
+        logger.error("No title found, skipping listing")
+        return {}
+    
+    if not properties:
+        logger.error("No properties found, skipping listing")
+        return {}
+    
+    car_data = build_car_data(title, texts, properties, images, is_dealer, url)
+    
+    # Log extracted data; %-style so the dict is only formatted when debugging
+    logger.debug("Extracted car data: %s", car_data)
+    return car_data
+
+async def scrape_specific_listing(client: httpx.AsyncClient, limiter: RateLimiter,
+                                  executor: Executor, url: str) -> Dict:
+    """Scrape details from a specific car listing URL, parsing it in the worker pool."""
+    logger.debug("Scraping specific listing: %s", url)
     
     try:
-        html = fetch_page(url)
+        html = await fetch_page(client, limiter, url)
         if not html:
             logger.error(f"Failed to fetch page: {url}")
             return {}
-            
-        soup = BeautifulSoup(html, 'lxml')
-        
-        # Extract basic information
-        title_elem = soup.select_one('h1.product-title')
-        price_elem = soup.select_one('div.product-price__i')
-        description = soup.select_one('div.product-description')
-        
-        if not title_elem:
-            logger.error("No title found, skipping listing")
-            return {}
-            
-        title = title_elem.text.strip()
         
-        # Get detailed properties
-        properties = parse_car_details(soup)
-        if not properties:
-            logger.error("No properties found, skipping listing")
+        if _TITLE_CLASS not in html:
+            # Not a listing page (e.g. removed ad); skip the round trip to a worker
+            logger.error(f"No title found, skipping listing {url}")
             return {}
         
-        # Extract images
-        image_elements = soup.select('div.product-photos__img img')
-        images = [img.get('src') for img in image_elements if img.get('src')]
-        
-        # Process car data
-        car_data = {
-            'title': title,
-            'price': extract_price(price_elem.text.strip() if price_elem else None),
-            'description': description.text.strip() if description else None,
-            'location': properties.get('location'),
-            'brand': properties.get('brand'),
-            'model': properties.get('model'),
-            'year': int(properties.get('year', 0)),
-            'body_type': properties.get('body_type'),
-            'color': properties.get('color'),
-            'engine_size': extract_engine_size(properties.get('engine_size')),
-            'mileage': float(properties.get('mileage', '0').replace(' ', '').replace('km', '')),
-            'transmission': properties.get('transmission'),
-            'fuel_type': extract_fuel_type(properties, title),
-            'seller_type': 'Dealer' if soup.select_one('div.shop-contact') else 'Private',
-            'images': json.dumps(images) if images else None,
-            'url': url
-        }
-        
-        # Log extracted data
-        logger.info(f"Extracted car data: {car_data}")
-        return car_data
+        # Parsing is CPU-bound; keep it off the event loop and spread it over cores
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, parse_listing, html, url)
         
     except Exception as e:
         logger.error(f"Error scraping listing {url}: {str(e)}")
@@ -301,65 +474,185 @@ def save_to_database(car_data: Dict) -> None:
         
         # Save to database
         save_car_to_db(car)
-        logger.info(f"Successfully saved car {car_data['listing_id']} to database")
+        logger.debug("Successfully saved car %s to database", car_data['listing_id'])
         
     except Exception as e:
         logger.error(f"Error saving car to database: {str(e)}")
         raise  # Re-raise to handle in main
 
-def get_total_pages() -> int:
+async def get_total_pages(client: httpx.AsyncClient, limiter: RateLimiter) -> int:
     """Get the total number of pages available."""
-    html = fetch_page(BASE_URL)
+    html = await fetch_page(client, limiter, BASE_URL, INDEX_CACHE_TTL)
     if not html:
         return 0
     
-    soup = BeautifulSoup(html, 'lxml')
-    pagination = soup.find('div', class_='pagination')
+    tree = LexborHTMLParser(html)
+    pagination = tree.css_first(_PAGINATION_CSS)
     if not pagination:
         return 1
         
     try:
-        last_page = pagination.find_all('a')[-2].text.strip()
+        last_page = pagination.css('a')[-2].text().strip()
         return int(last_page)
     except (IndexError, ValueError):
         logger.error("Could not determine total pages")
         return 0
 
-def display_data_summary(df: pd.DataFrame) -> None:
-    """Display a summary of the collected data."""
+def display_data_summary(path: str) -> None:
+    """Display a summary of the collected data.
+
+    Reads only the summarised columns and counts them with plain Python,
+    so no DataFrame of the whole dataset is built.
+    """
+    columns = pq.read_table(path, columns=SUMMARY_COLUMNS).to_pydict()
+    total = len(columns['listing_id'])
+    
     print("\n" + "="*50)
     print("SCRAPING RESULTS SUMMARY")
     print("="*50)
     
     # Basic statistics
-    print(f"\nTotal cars collected: {len(df)}")
+    print(f"\nTotal cars collected: {total}")
     
-    if not df.empty:
+    if total:
         # Brand distribution
-        if 'brand' in df.columns:
-            print("\nTop 5 Brands:")
-            print(df['brand'].value_counts().head())
+        print("\nTop 5 Brands:")
+        for brand, count in Counter(b for b in columns['brand'] if b).most_common(5):
+            print(f"{brand}: {count}")
         
         # Price statistics
-        if 'price' in df.columns:
+        prices = [p for p in columns['price'] if p is not None]
+        if prices:
             print("\nPrice Statistics:")
-            print(df['price'].describe())
+            quartiles = statistics.quantiles(prices, n=4, method='inclusive') if len(prices) > 1 else [prices[0]] * 3
+            print(f"count: {len(prices)}")
+            print(f"mean: {statistics.fmean(prices):.2f}")
+            print(f"min: {min(prices):.2f}")
+            for label, value in zip(('25%', '50%', '75%'), quartiles):
+                print(f"{label}: {value:.2f}")
+            print(f"max: {max(prices):.2f}")
         
         # Year distribution
-        if 'year' in df.columns:
-            print("\nYear Distribution:")
-            print(df['year'].value_counts().sort_index().head())
+        print("\nYear Distribution:")
+        for year, count in sorted(Counter(y for y in columns['year'] if y is not None).items())[:5]:
+            print(f"{year}: {count}")
         
         # Sample entries
         print("\nSample Entries (5 random cars):")
         sample_columns = ['brand', 'model', 'year', 'price', 'mileage']
-        available_columns = [col for col in sample_columns if col in df.columns]
-        print(df[available_columns].sample(min(5, len(df))).to_string())
+        print("  ".join(sample_columns))
+        for idx in random.sample(range(total), min(5, total)):
+            print("  ".join(str(columns[col][idx]) for col in sample_columns))
     
     print("\n" + "="*50)
 
-def main():
-    """Main function to run the scraper."""
+async def scrape_listing_to_queue(client: httpx.AsyncClient, limiter: RateLimiter,
+                                  executor: Executor, queue: asyncio.Queue, listing_id: str) -> None:
+    """Scrape one listing and hand the result to the writer task."""
+    car_details = await scrape_specific_listing(client, limiter, executor, f"{BASE_URL}/{listing_id}")
+    if car_details:
+        car_details['listing_id'] = listing_id
+        await queue.put(car_details)
+
+class ListingWriter:
+    """Single consumer that checkpoints scraped listings and saves them to the database."""
+
+    def __init__(self, store: ProgressStore):
+        self.store = store
+        self.collected = 0
+        self.saved_to_db = 0
+        self._db_batch: List[Dict] = []
+
+    async def consume(self, queue: asyncio.Queue) -> None:
+        """Drain the queue forever; cancelled by the caller once it has been joined."""
+        while True:
+            car_details = await queue.get()
+            try:
+                self.write(car_details)
+            except Exception as e:
+                logger.error(f"Error processing listing {car_details.get('listing_id')}: {str(e)}")
+            finally:
+                queue.task_done()
+
+    def write(self, car_details: Dict) -> None:
+        """Checkpoint one listing and queue it for the next database batch."""
+        self.store.add(car_details)
+        self.collected += 1
+        
+        # Save to database in batches rather than one transaction per car
+        self._db_batch.append(car_details)
+        if len(self._db_batch) >= DB_BATCH_SIZE:
+            self.flush_database()
+        
+        # Show real-time progress
+        print(f"\rCars collected: {self.collected} (Saved to DB: {self.saved_to_db})", end="")
+
+    def flush_database(self) -> None:
+        """Upsert the pending batch, falling back to per-car saves if it is rejected."""
+        if not self._db_batch:
+            return
+        try:
+            save_cars_to_db(self._db_batch)
+            self.saved_to_db += len(self._db_batch)
+        except Exception as e:
+            # Warning: e.g. one malformed row; save the batch row by row so the rest still land
+            logger.warning(f"Batch insert failed ({str(e)}), saving {len(self._db_batch)} cars individually")
+            for car_details in self._db_batch:
+                try:
+                    save_to_database(car_details)
+                    self.saved_to_db += 1
+                except Exception as e:
+                    logger.error(f"Error processing listing {car_details.get('listing_id')}: {str(e)}")
+        self._db_batch.clear()
+
+    def flush(self) -> None:
+        """Write out everything still buffered."""
+        self.store.flush()
+        self.flush_database()
+
+async def crawl_pages(client: httpx.AsyncClient, limiter: RateLimiter, executor: Executor,
+                      queue: asyncio.Queue, seen_ids: Set[str], max_pages: int) -> None:
+    """Walk the listing index and queue every listing not seen before."""
+    # Iterate through pages
+    for page in range(1, max_pages + 1):
+        logger.info(f"Processing page {page}/{max_pages}")
+        
+        # Get listing IDs from the current page
+        listing_ids = await get_all_listing_ids(client, limiter, page)
+        new_ids = [listing_id for listing_id in dict.fromkeys(listing_ids) if listing_id not in seen_ids]
+        seen_ids.update(new_ids)
+        logger.debug(f"Skipping {len(listing_ids) - len(new_ids)} already seen listings on page {page}")
+        
+        # Fetch every new listing on the page concurrently
+        await asyncio.gather(*[
+            scrape_listing_to_queue(client, limiter, executor, queue, listing_id)
+            for listing_id in new_ids
+        ])
+
+def export_cars_to_parquet(path: str) -> int:
+    """Write every listing in the cars table to a Parquet file and return the row count.
+
+    The file is built beside ``path`` and only moved into place when it holds
+    rows, so an empty or failed export never replaces the published dataset.
+    """
+    tmp_path = f"{path}.tmp"
+    exported = 0
+    try:
+        with pq.ParquetWriter(tmp_path, LISTING_SCHEMA, compression='zstd') as writer:
+            for rows in iter_car_rows(LISTING_SCHEMA.names, PARQUET_ROW_GROUP_SIZE):
+                writer.write_batch(pa.RecordBatch.from_pylist(
+                    [dict(zip(LISTING_SCHEMA.names, row)) for row in rows], schema=LISTING_SCHEMA
+                ))
+                exported += len(rows)
+        if exported:
+            os.replace(tmp_path, path)
+    finally:
+        with suppress(FileNotFoundError):
+            os.remove(tmp_path)
+    return exported
+
+async def run_scraper() -> None:
+    """Scrape all pages, fetching each page's listings concurrently."""
     try:
         logger.info("Starting the car scraper")
         
@@ -370,64 +663,80 @@ def main():
         init_db()
         logger.info("Database initialized")
         
-        # Get total pages
-        total_pages = get_total_pages()
-        logger.info(f"Total pages to scrape: {total_pages}")
+        # One client (and connection pool) for the whole crawl; the limiter
+        # caps requests in flight and paces them across all coroutines
+        limiter = RateLimiter(MAX_CONCURRENT_REQUESTS, REQUESTS_PER_SECOND, REQUEST_BURST)
         
-        if total_pages == 0:
-            logger.error("Could not determine total pages. Exiting.")
-            return
-            
-        # Initialize list to store all car details
-        all_cars = []
-        saved_to_db = 0
+        # Size the keep-alive pool to the concurrency cap. With HTTP/2 the
+        # requests are multiplexed as streams over a single TLS connection.
+        limits = httpx.Limits(max_connections=MAX_CONCURRENT_REQUESTS,
+                              max_keepalive_connections=MAX_CONCURRENT_REQUESTS)
         
-        # Set the maximum pages to scrape
-        max_pages = min(total_pages, DEFAULT_MAX_PAGES) if DEFAULT_MAX_PAGES else total_pages
-        
-        # Iterate through pages
-        for page in range(1, max_pages + 1):
-            logger.info(f"Processing page {page}/{max_pages}")
-            
-            # Get listing IDs from the current page
-            listing_ids = get_all_listing_ids(page)
-            
-            # Process each listing
-            for listing_id in listing_ids:
+        # Listing pages are parsed in worker processes so parsing scales with cores.
+        # Scraped rows are checkpointed to SQLite so an interrupted run resumes
+        # where it stopped; the checkpoint is cleared once the run completes.
+        progress_path = os.path.join(OUTPUT_DIRECTORY, PROGRESS_DB_FILENAME)
+        with ProcessPoolExecutor(max_workers=PARSE_WORKERS) as executor, \
+                ProgressStore(progress_path, LISTING_SCHEMA, PROGRESS_BATCH_SIZE) as store:
+            # Redirects are followed like the old requests client did; httpx
+            # would otherwise return the 3xx and the listing would be dropped
+            async with httpx.AsyncClient(http2=True, limits=limits, headers=REQUEST_HEADERS,
+                                         timeout=REQUEST_TIMEOUT, follow_redirects=True) as client:
+                # Get total pages
+                total_pages = await get_total_pages(client, limiter)
+                logger.info(f"Total pages to scrape: {total_pages}")
+                
+                if total_pages == 0:
+                    logger.error("Could not determine total pages. Exiting.")
+                    return
+                
+                # Set the maximum pages to scrape
+                max_pages = min(total_pages, DEFAULT_MAX_PAGES) if DEFAULT_MAX_PAGES else total_pages
+                
+                # Listings checkpointed by an interrupted run or seen on an earlier
+                # page are not fetched again. Listings already in the database are
+                # too when REFRESH_SAVED_LISTINGS is set, so the upsert refreshes
+                # their price; the HTML cache keeps that cheap.
+                seen_ids = store.listing_ids()
+                if not REFRESH_SAVED_LISTINGS:
+                    seen_ids |= get_saved_listing_ids()
+                
+                # Scraping coroutines only push rows onto the queue; a single
+                # writer task owns the checkpoint and the database writes
+                queue = asyncio.Queue(maxsize=LISTING_QUEUE_SIZE)
+                listing_writer = ListingWriter(store)
+                writer_task = asyncio.create_task(listing_writer.consume(queue))
+                
                 try:
-                    listing_url = f"{BASE_URL}/{listing_id}"
-                    car_details = scrape_specific_listing(listing_url)
+                    await crawl_pages(client, limiter, executor, queue, seen_ids, max_pages)
                     
-                    if car_details:
-                        car_details['listing_id'] = listing_id
-                        all_cars.append(car_details)
-                        
-                        # Save to database
-                        save_to_database(car_details)
-                        saved_to_db += 1
-                        
-                        # Show real-time progress
-                        print(f"\rCars collected: {len(all_cars)} (Saved to DB: {saved_to_db})", end="")
-                    
-                    # Respect rate limiting
-                    sleep(DELAY_BETWEEN_REQUESTS)
-                    
-                except Exception as e:
-                    logger.error(f"Error processing listing {listing_id}: {str(e)}")
-                    continue
+                    # Wait for the writer to drain everything that was scraped
+                    await queue.join()
+                finally:
+                    writer_task.cancel()
+                    with suppress(asyncio.CancelledError):
+                        await writer_task
+                    listing_writer.flush()
             
-            # Save progress to CSV after each page
-            if all_cars:
-                df = pd.DataFrame(all_cars)
-                df.to_csv(os.path.join(OUTPUT_DIRECTORY, CSV_FILENAME), index=False)
-                logger.info(f"Saved {len(all_cars)} cars to CSV")
+            # The run is complete: drop the checkpoint
+            store.clear()
+        
+        # Publish the whole cars table, not just this run's listings
+        data_path = os.path.join(OUTPUT_DIRECTORY, PARQUET_FILENAME)
+        exported = export_cars_to_parquet(data_path)
+        if exported:
+            logger.info(f"Saved {exported} cars to {data_path}")
+        else:
+            # Warning: keep the previous dataset rather than publishing an empty one
+            logger.warning(f"No cars in the database, leaving {data_path} unchanged")
 
         # Display final summary
-        if all_cars:
+        if exported:
             print(f"\nFinal Statistics:")
-            print(f"Total cars collected: {len(all_cars)}")
-            print(f"Total cars saved to database: {saved_to_db}")
-            display_data_summary(pd.DataFrame(all_cars))
+            print(f"Total cars collected: {listing_writer.collected}")
+            print(f"Total cars in dataset: {exported}")
+            print(f"Total cars saved to database: {listing_writer.saved_to_db}")
+            display_data_summary(data_path)
         
         logger.info("Scraping completed successfully")
         
@@ -435,5 +744,9 @@ def main():
         logger.critical(f"Unexpected error in main process: {str(e)}")
         raise
 
+def main():
+    """Main function to run the scraper."""
+    asyncio.run(run_scraper())
+
 if __name__ == '__main__':
     main()
\ No newline at end of file
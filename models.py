@@ -1,8 +1,9 @@
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Text
+from sqlalchemy import create_engine, event, text, Column, Integer, String, Float, DateTime, Text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from datetime import datetime
-from typing import Optional
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Set
 import os
 from dotenv import load_dotenv
 import logging
@@ -20,7 +21,16 @@ DATABASE_URL = os.getenv('DATABASE_URL', 'sqlite:///./data/cars.db')
 os.makedirs('./data', exist_ok=True)
 
 # Create SQLAlchemy engine
-engine = create_engine(DATABASE_URL, echo=True)  # Added echo=True for debugging
+engine = create_engine(DATABASE_URL, pool_pre_ping=True)
+
+if engine.dialect.name == 'sqlite':
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """Use WAL so batched writes don't block readers and commit without a full fsync."""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
 
 # Create declarative base
 Base = declarative_base()
@@ -56,9 +66,7 @@ class Car(Base):
 def init_db():
     """Initialize database and create tables."""
     try:
-        # Drop all tables first to ensure clean state
-        Base.metadata.drop_all(bind=engine)
-        # Create all tables
+        # Create missing tables; existing data is kept so runs build on each other
         Base.metadata.create_all(bind=engine)
         logger.info("Database initialized successfully")
     except Exception as e:
@@ -73,8 +81,49 @@ def get_db():
     finally:
         db.close()
 
+def get_saved_listing_ids() -> Set[str]:
+    """Return the listing IDs already stored in the database."""
+    session = SessionLocal()
+    try:
+        return {listing_id for (listing_id,) in session.query(Car.listing_id)}
+    finally:
+        session.close()
+
+def iter_car_rows(columns: List[str], batch_size: int) -> Iterator[List[tuple]]:
+    """Yield every stored listing, ``batch_size`` rows of the given columns at a time."""
+    with engine.connect() as conn:
+        result = conn.execution_options(stream_results=True).execute(
+            text(f"SELECT {', '.join(columns)} FROM {Car.__tablename__}")
+        )
+        while True:
+            rows = result.fetchmany(batch_size)
+            if not rows:
+                break
+            yield rows
+
 def save_car_to_db(car: Car) -> None:
     """Save a car instance to the database."""
+    stmt = car_upsert_statement()
+    if stmt is None:
+        _save_car_with_session(car)
+        return
+
+    try:
+        # A single INSERT ... ON CONFLICT replaces the SELECT-then-INSERT/UPDATE
+        now = datetime.utcnow()
+        payload = {col.name: getattr(car, col.name) for col in Car.__table__.columns if col.name != 'id'}
+        payload['created_at'] = now
+        payload['updated_at'] = now
+        with engine.begin() as conn:
+            conn.execute(stmt, payload)
+        logger.info(f"Successfully saved car {car.listing_id} to database")
+
+    except Exception as e:
+        logger.error(f"Error saving car to database: {str(e)}")
+        raise
+
+def _save_car_with_session(car: Car) -> None:
+    """Upsert through the ORM on backends without ON CONFLICT support."""
     session = SessionLocal()
     try:
         # Check if car already exists
@@ -103,3 +152,51 @@ def save_car_to_db(car: Car) -> None:
         raise
     finally:
         session.close()
+
+@lru_cache(maxsize=None)
+def car_upsert_statement():
+    """INSERT that updates the existing row when listing_id is already stored.
+
+    Built once and reused. Returns None on backends without ON CONFLICT support.
+    """
+    if engine.dialect.name == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert
+    elif engine.dialect.name == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        return None
+
+    stmt = insert(Car.__table__)
+    # Keep the original id and created_at of a listing that is scraped again
+    preserved = {'id', 'listing_id', 'created_at'}
+    return stmt.on_conflict_do_update(
+        index_elements=['listing_id'],
+        set_={col.name: stmt.excluded[col.name] for col in Car.__table__.columns if col.name not in preserved}
+    )
+
+def save_cars_to_db(cars: List[Dict]) -> None:
+    """Upsert a batch of car rows in a single transaction."""
+    now = datetime.utcnow()
+    rows = [{**car, 'created_at': now, 'updated_at': now} for car in cars]
+
+    stmt = car_upsert_statement()
+    try:
+        if stmt is not None:
+            # One executemany of the upsert; no per-row SELECT or commit
+            with engine.begin() as conn:
+                conn.execute(stmt, rows)
+        else:
+            session = SessionLocal()
+            try:
+                session.bulk_insert_mappings(Car, rows)
+                session.commit()
+            except Exception:
+                session.rollback()
+                raise
+            finally:
+                session.close()
+        logger.info(f"Saved batch of {len(cars)} cars to database")
+
+    except Exception as e:
+        logger.error(f"Error saving car batch to database: {str(e)}")
+        raise
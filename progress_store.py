@@ -0,0 +1,81 @@
+"""
+SQLite checkpoint of scraped listings, used to resume interrupted crawls.
+"""
+import sqlite3
+from typing import Dict, List, Set
+
+import pyarrow as pa
+
+# SQLite column types for the Arrow types used by the listing schema
+_SQLITE_TYPES = {
+    pa.string(): 'TEXT',
+    pa.float64(): 'REAL',
+    pa.int64(): 'INTEGER',
+}
+
+
+class ProgressStore:
+    """Checkpoints listings row by row into a WAL-mode SQLite file keyed by ``listing_id``.
+
+    Rows are buffered and written with one ``executemany`` per batch. Because
+    ``listing_id`` is the primary key, re-scraped listings replace their old row
+    instead of duplicating it.
+    """
+
+    def __init__(self, path: str, schema: pa.Schema, batch_size: int = 1000):
+        self.path = path
+        self.schema = schema
+        self.batch_size = batch_size
+        self._pending: List[tuple] = []
+
+        columns = ', '.join(
+            f"{name} {_SQLITE_TYPES[schema.field(name).type]}"
+            + (' PRIMARY KEY' if name == 'listing_id' else '')
+            for name in schema.names
+        )
+        self._insert_sql = (
+            f"INSERT OR REPLACE INTO listings ({', '.join(schema.names)}) "
+            f"VALUES ({', '.join('?' for _ in schema.names)})"
+        )
+
+        self._conn = sqlite3.connect(path)
+        self._conn.executescript(f"""
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            CREATE TABLE IF NOT EXISTS listings ({columns});
+        """)
+
+    def __enter__(self) -> 'ProgressStore':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def listing_ids(self) -> Set[str]:
+        """IDs checkpointed by this or an earlier, interrupted run."""
+        return {listing_id for (listing_id,) in self._conn.execute("SELECT listing_id FROM listings")}
+
+    def add(self, row: Dict) -> None:
+        """Buffer one listing, writing the batch out once it is full."""
+        self._pending.append(tuple(row.get(name) for name in self.schema.names))
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered listings in a single transaction."""
+        if not self._pending:
+            return
+        with self._conn:
+            self._conn.executemany(self._insert_sql, self._pending)
+        self._pending.clear()
+
+    def clear(self) -> None:
+        """Drop the checkpoint once a run has completed."""
+        self._pending.clear()
+        with self._conn:
+            self._conn.execute("DELETE FROM listings")
+
+    def close(self) -> None:
+        """Flush pending rows and close the connection."""
+        self.flush()
+        self._conn.close()
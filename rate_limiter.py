@@ -0,0 +1,99 @@
+"""
+Async rate limiting shared by every request of a crawl.
+"""
+import asyncio
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Mapping, Optional
+
+
+class RateLimiter:
+    """Caps in-flight requests and paces them with a token bucket.
+
+    The bucket refills at ``rate`` tokens per second up to ``burst`` tokens, so
+    short bursts go out at full speed and only the excess waits. When the server
+    advertises its own limits (``Retry-After``, ``X-RateLimit-Remaining``,
+    ``X-RateLimit-Reset``) they take precedence over the local estimate.
+    """
+
+    def __init__(self, max_concurrency: int, rate: float, burst: Optional[float] = None):
+        self._semaphore = asyncio.BoundedSemaphore(max_concurrency)
+        self._lock = asyncio.Lock()
+        self._rate = rate
+        self._burst = burst if burst is not None else max(1.0, rate)
+        self._tokens = self._burst
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+
+    async def __aenter__(self) -> 'RateLimiter':
+        await self._semaphore.acquire()
+        try:
+            await self._take_token()
+        except BaseException:
+            self._semaphore.release()
+            raise
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self._semaphore.release()
+
+    async def _take_token(self) -> None:
+        """Wait until a token is available (and any server-imposed pause is over), then consume it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    await asyncio.sleep(self._blocked_until - now)
+                    continue
+
+                self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every request for the next ``seconds``."""
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """Adjust the bucket to the limits the server reported in a response."""
+        retry_after = _parse_seconds(headers.get('Retry-After'))
+        if retry_after is not None:
+            self.pause(retry_after)
+
+        remaining = headers.get('X-RateLimit-Remaining')
+        if remaining is None:
+            return
+        try:
+            self._tokens = min(self._tokens, float(remaining))
+        except ValueError:
+            return
+
+        if self._tokens < 1:
+            reset = _parse_seconds(headers.get('X-RateLimit-Reset'))
+            if reset is not None:
+                # Some servers send an epoch timestamp rather than a delay
+                if reset > 1e9:
+                    reset = max(0.0, reset - time.time())
+                self.pause(reset)
+
+
+def _parse_seconds(value: Optional[str]) -> Optional[float]:
+    """Parse a header holding either a delay in seconds or an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
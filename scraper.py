@@ -1,22 +1,32 @@
-import pandas as pd
-import requests
+import asyncio
+import csv
+import httpx
 import logging
 import logging.config
 import os
-from time import sleep
-from bs4 import BeautifulSoup
-from typing import List, Dict, Optional, Any
+import json
+import random
+import re
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import suppress
+from itertools import count
+from selectolax.lexbor import LexborHTMLParser
+from typing import List, Dict, Optional, Set, TextIO
 from dataclasses import dataclass, field
 from copy import deepcopy
 from datetime import datetime
 
-from models import init_db, SessionLocal, save_car_to_db, Car
+from models import init_db, Car, save_car_to_db, save_cars_to_db, get_saved_listing_ids
+from rate_limiter import RateLimiter
+from html_cache import HTMLCache
 
 from config import (
     BASE_URL, REQUEST_HEADERS, REQUEST_TIMEOUT,
-    DELAY_BETWEEN_REQUESTS, MAX_RETRIES,
+    DELAY_BETWEEN_REQUESTS, MAX_RETRIES, MAX_CONCURRENT_REQUESTS,
+    REQUESTS_PER_SECOND, REQUEST_BURST, PARSE_WORKERS, HTML_CACHE_DIR, HTML_CACHE_TTL, INDEX_CACHE_TTL,
     SELECTORS, LABEL_MAPPING, LOGGING_CONFIG,
-    OUTPUT_DIRECTORY, CSV_FILENAME, DEFAULT_MAX_PAGES
+    OUTPUT_DIRECTORY, CSV_FILENAME, SCRAPER_STATE_FILENAME, SCRAPER_FLUSH_BATCH, DEFAULT_MAX_PAGES,
+    REFRESH_SAVED_LISTINGS
 )
 
 
@@ -24,6 +34,64 @@ from config import (
 logging.config.dictConfig(LOGGING_CONFIG)
 logger = logging.getLogger(__name__)
 
+# 4xx statuses worth retrying (timeout, rate limit); any other 4xx is final
+_RETRYABLE_CLIENT_ERRORS = (408, 429)
+# Upper bound in seconds on a single retry backoff
+_MAX_BACKOFF = 60
+
+# CSS selectors resolved once at import time instead of on every query
+_PAGINATION_CSS = SELECTORS['pagination']
+_PRODUCT_LINK_CSS = SELECTORS['product_link']
+_PRODUCT_LINK_CLASS = _PRODUCT_LINK_CSS.rsplit('.', 1)[-1]
+_PROPERTY_NAME_CSS = SELECTORS['property_name']
+_PROPERTY_VALUE_CSS = SELECTORS['property_value']
+# Property labels and values matched in one tree walk; labels are told apart by tag
+_PROPERTY_FIELDS_CSS = f"{_PROPERTY_NAME_CSS}, {_PROPERTY_VALUE_CSS}"
+_PROPERTY_NAME_TAG = _PROPERTY_NAME_CSS.split('.', 1)[0]
+_PRICE_CSS = SELECTORS['price']
+_TITLE_CSS = SELECTORS['title']
+_DESCRIPTION_CSS = SELECTORS['description']
+_SHOP_CONTACT_CSS = SELECTORS['shop_contact']
+_OWNER_INFO_CSS = SELECTORS['owner_info']
+_IMAGES_CSS = SELECTORS['images']
+
+# Listing ID at the start of a product link's slug, e.g. /autos/1234567-bmw-x5
+_LISTING_ID_RE = re.compile(r'/autos/(\d+)')
+# Number parsing for prices ("25 500 AZN"), engine sizes ("1.6 L") and mileage ("150 000 km")
+_NON_DIGIT_RE = re.compile(r'\D+')
+_ENGINE_SIZE_RE = re.compile(r'[\d.]+')
+_NON_NUMBER_RE = re.compile(r'[^\d.]+')
+
+@dataclass
+class CarListing:
+    """One scraped listing. Declared with __slots__ so the rows held between saves stay small."""
+    __slots__ = (
+        'title', 'price', 'description', 'location', 'brand', 'model', 'year',
+        'body_type', 'color', 'engine_size', 'mileage', 'transmission',
+        'listing_id', 'url', 'fuel_type', 'seller_type', 'images'
+    )
+    title: str
+    price: float
+    description: Optional[str]
+    location: Optional[str]
+    brand: Optional[str]
+    model: Optional[str]
+    year: int
+    body_type: Optional[str]
+    color: Optional[str]
+    engine_size: float
+    mileage: float
+    transmission: Optional[str]
+    listing_id: str
+    url: str
+    fuel_type: Optional[str]
+    seller_type: Optional[str]
+    images: Optional[List[str]]
+
+
+# Listing fields: the CSV export's column order, and the cars table columns a listing fills
+_CAR_FIELDS = CarListing.__slots__
+
 
 @dataclass
 class ScrapingConfig:
@@ -33,8 +101,18 @@ class ScrapingConfig:
     timeout: int = REQUEST_TIMEOUT
     delay: int = DELAY_BETWEEN_REQUESTS
     max_retries: int = MAX_RETRIES
+    concurrency: int = MAX_CONCURRENT_REQUESTS
+    requests_per_second: float = REQUESTS_PER_SECOND
+    burst: int = REQUEST_BURST
+    parse_workers: Optional[int] = PARSE_WORKERS
+    cache_dir: str = HTML_CACHE_DIR
+    listing_cache_ttl: float = HTML_CACHE_TTL
+    index_cache_ttl: float = INDEX_CACHE_TTL
     output_dir: str = OUTPUT_DIRECTORY
     csv_filename: str = CSV_FILENAME
+    state_filename: str = SCRAPER_STATE_FILENAME
+    flush_batch: int = SCRAPER_FLUSH_BATCH
+    refresh_saved_listings: bool = REFRESH_SAVED_LISTINGS
 
 
 class TurboAzScraper:
@@ -44,72 +122,142 @@ class TurboAzScraper:
         """Initialize the scraper and create output directory."""
         self.config = ScrapingConfig()
         os.makedirs(self.config.output_dir, exist_ok=True)
-        self._cars_data: List[Dict[str, Any]] = []
-        self.db = SessionLocal()
-
-    def __del__(self):
-        """Cleanup database session."""
-        if hasattr(self, 'db'):
-            self.db.close()
+        self._cars_data: List[CarListing] = []
+        # Batch being written while scraping continues; saves run one at a
+        # time so checkpoints are written in page order
+        self._save_task: Optional[asyncio.Task] = None
+        # Listings dispatched this run (plus those in the database unless they are
+        # being refreshed); pagination shifts as new ads arrive, so adjacent pages
+        # often repeat IDs
+        self._seen_ids: Set[str] = set()
+        # Resume checkpoint: the last page whose listings are all saved or
+        # buffered for the next save
+        self._state_file = os.path.join(self.config.output_dir, self.config.state_filename)
+        self._last_page_done = 0
+        # Set once a batch loses cars; later batches then leave the checkpoint alone
+        self._checkpoint_held = False
+        # One CSV per run, opened on the first save and appended to afterwards
+        self._csv_fh: Optional[TextIO] = None
+        self._csv_writer = None
+
+        # One keep-alive client shared by every coroutine, so requests reuse the TCP/TLS
+        # connections; the pool is sized to the number of listings fetched at once.
+        # With HTTP/2 the requests share a single connection, so turbo.az is
+        # resolved and handshaken once per run rather than once per socket.
+        # Redirects are followed as requests did; httpx would return the 3xx.
+        self.client = httpx.AsyncClient(
+            http2=True,
+            headers=self.config.headers,
+            timeout=self.config.timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=self.config.concurrency,
+                                max_keepalive_connections=self.config.concurrency)
+        )
+        # Created by run() inside the event loop it paces
+        self.limiter: Optional[RateLimiter] = None
+        # Worker processes for listing parsing, started by run()
+        self.executor: Optional[ProcessPoolExecutor] = None
+        # Pages downloaded by earlier runs, so re-runs skip unchanged listings
+        self.cache = HTMLCache(self.config.cache_dir)
+
+    async def __aenter__(self) -> 'TurboAzScraper':
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close pooled HTTP connections, the parse workers and the CSV file."""
+        await self.client.aclose()
+        if self.executor:
+            self.executor.shutdown()
+            self.executor = None
+        if self._csv_fh:
+            self._csv_fh.close()
+            self._csv_fh, self._csv_writer = None, None
 
     @classmethod
     def create_scraper(cls) -> 'TurboAzScraper':
         """Factory method to create a scraper instance."""
         return cls()
 
-    def fetch_page(self, url: str) -> Optional[str]:
+    async def fetch_page(self, url: str, cache_ttl: float) -> Optional[str]:
         """
-        Fetch page content with retries.
+        Fetch page content with retries, served from the on-disk cache while fresh.
 
         Args:
             url: The URL to fetch
+            cache_ttl: Seconds a cached copy is used without asking the server;
+                older copies are revalidated with a conditional GET
 
         Returns:
             Optional[str]: The page content if successful, None otherwise
         """
+        cached = self.cache.get(url)
+        if cached and cached.is_fresh(cache_ttl):
+            logger.debug("Serving %s from cache", url)
+            return cached.html
+        conditional_headers = cached.validators() if cached else None
+
         for attempt in range(self.config.max_retries):
             try:
-                logger.info(f"Fetching URL: {url}")
-                response = requests.get(
-                    url,
-                    headers=self.config.headers,
-                    timeout=self.config.timeout
-                )
+                logger.debug("Fetching %s", url)
+                async with self.limiter:
+                    response = await self.client.get(url, headers=conditional_headers)
+                # Let the server's advertised limits steer the shared bucket
+                self.limiter.update_from_headers(response.headers)
+                logger.debug("Content-Encoding for %s: %s", url, response.headers.get('Content-Encoding'))
+                if response.status_code == 304 and cached:
+                    logger.debug("Not modified, using cached copy of %s", url)
+                    self.cache.touch(url)
+                    return cached.html
                 response.raise_for_status()
-                logger.info(f"Successfully fetched {url}")
+                logger.debug("Fetched %s", url)
+                self.cache.put(url, response.text, response.headers.get('ETag'),
+                               response.headers.get('Last-Modified'))
                 return response.text
 
-            except requests.RequestException as e:
-                logger.error(f"Attempt {attempt + 1}/{self.config.max_retries} failed: {str(e)}")
-                if attempt < self.config.max_retries - 1:
-                    sleep(self.config.delay * (attempt + 1))
-                    continue
+            except httpx.HTTPStatusError as e:
+                status = e.response.status_code
+                if 400 <= status < 500 and status not in _RETRYABLE_CLIENT_ERRORS:
+                    # Removed or forbidden listing: asking again won't change the answer
+                    logger.warning("Giving up on %s: status %d", url, status)
+                    return None
+                logger.error("Attempt %d/%d failed for %s: %s", attempt + 1, self.config.max_retries, url, e)
+            except httpx.HTTPError as e:
+                logger.error("Attempt %d/%d failed for %s: %s", attempt + 1, self.config.max_retries, url, e)
+
+            if attempt < self.config.max_retries - 1:
+                # Exponential backoff with jitter; a Retry-After header has already
+                # paused the limiter, so the retry also waits that out
+                backoff = (2 ** attempt) * self.config.delay + random.uniform(0, self.config.delay)
+                await asyncio.sleep(min(_MAX_BACKOFF, backoff))
         return None
 
-    def get_total_pages(self) -> int:
+    async def get_total_pages(self) -> int:
         """
         Get the total number of pages available.
 
         Returns:
             int: Total number of pages, 0 if unable to determine
         """
-        html = self.fetch_page(self.config.base_url)
+        html = await self.fetch_page(self.config.base_url, self.config.index_cache_ttl)
         if not html:
             return 0
 
-        soup = BeautifulSoup(html, 'lxml')
-        pagination = soup.find('div', class_='pagination')
+        tree = LexborHTMLParser(html)
+        pagination = tree.css_first(_PAGINATION_CSS)
         if not pagination:
             return 1
 
         try:
-            last_page = pagination.find_all('a')[-2].text.strip()
+            last_page = pagination.css('a')[-2].text().strip()
             return int(last_page)
         except (IndexError, ValueError):
             logger.error("Could not determine total pages")
             return 0
 
-    def get_listing_ids(self, page_number: int) -> List[str]:
+    async def get_listing_ids(self, page_number: int) -> List[str]:
         """
         Get all listing IDs from a specific page.
 
@@ -120,78 +268,82 @@ class TurboAzScraper:
             List[str]: List of listing IDs found on the page
         """
         url = f"{self.config.base_url}?page={page_number}"
-        html = self.fetch_page(url)
-        if not html:
+        html = await self.fetch_page(url, self.config.index_cache_ttl)
+        # Pages past the end carry no product links; skip building a tree for them
+        if not html or _PRODUCT_LINK_CLASS not in html:
             return []
 
-        soup = BeautifulSoup(html, 'html.parser')
+        tree = LexborHTMLParser(html)
         listing_ids = []
-        product_links = soup.find_all(class_=SELECTORS['product_link'].split('.')[-1])
-        logger.info(f"Found {len(product_links)} product links")
+        product_links = tree.css(_PRODUCT_LINK_CSS)
+        logger.debug("Found %d product links", len(product_links))
 
         for link in product_links:
-            href = link.get('href')
+            href = link.attributes.get('href')
             if href:
-                try:
-                    listing_id = href.split('/')[2].split('-')[0]
-                    listing_ids.append(listing_id)
-                except IndexError:
-                    logger.error(f"Could not parse listing ID from href: {href}")
+                match = _LISTING_ID_RE.search(href)
+                if match:
+                    listing_ids.append(match.group(1))
+                else:
+                    logger.error("Could not parse listing ID from href: %s", href)
 
         return listing_ids
 
-    def parse_car_details(self, soup: BeautifulSoup) -> Dict[str, str]:
+    @staticmethod
+    def parse_car_details(tree: LexborHTMLParser) -> Dict[str, str]:
         """Parse car details from the properties section."""
         properties = {}
-        property_items = soup.find_all(class_=SELECTORS['property_item'].split('.')[-1])
-        logger.debug(f"Found {len(property_items)} property items")
-
-        for item in property_items:
+        # Labels and values come back in document order from a single walk,
+        # each value right after the label of its property item
+        name = None
+        for node in tree.css(_PROPERTY_FIELDS_CSS):
             try:
-                name_elem = item.find(class_=SELECTORS['property_name'].split('.')[-1])
-                value_elem = item.find(class_=SELECTORS['property_value'].split('.')[-1])
-
-                if name_elem and value_elem:
-                    name = name_elem.text.strip()
-                    value = value_elem.text.strip()
+                if node.tag == _PROPERTY_NAME_TAG:
+                    name = node.text().strip()
+                elif name is not None:
+                    value = node.text().strip()
                     field_name = LABEL_MAPPING.get(name, name)
                     properties[field_name] = value
-                    logger.info(f"Parsed property: {name} -> {field_name}: {value}")
+                    logger.debug("Parsed property: %s -> %s: %s", name, field_name, value)
+                    name = None
 
             except Exception as e:
                 logger.error(f"Error parsing property item: {str(e)}")
 
-        logger.info(f"All parsed properties: {properties}")
+        logger.debug("All parsed properties: %s", properties)
         return properties
 
-    def extract_price(self, soup):
+    @staticmethod
+    def extract_price(tree):
         """Extract price from the listing"""
         try:
-            price_element = soup.select_one('div.product-price__i')
+            price_element = tree.css_first(_PRICE_CSS)
             if price_element:
-                price_text = price_element.get_text(strip=True)
+                price_text = price_element.text(strip=True)
                 # Remove currency and spaces, convert to float
-                price = float(''.join(filter(str.isdigit, price_text)))
-                return price
+                digits = _NON_DIGIT_RE.sub('', price_text)
+                return float(digits) if digits else 0.0
             return 0.0
         except Exception as e:
             logger.error(f"Error extracting price: {str(e)}")
             return 0.0
 
-    def extract_engine_size(self, properties):
+    @staticmethod
+    def extract_engine_size(properties):
         """Extract engine size from properties"""
         try:
             engine_text = properties.get('engine_size', '')
             if engine_text:
                 # Extract numeric value from string like "1.6 L"
-                engine_size = float(''.join(c for c in engine_text if c.isdigit() or c == '.'))
-                return engine_size
+                match = _ENGINE_SIZE_RE.search(engine_text)
+                return float(match.group()) if match else 0.0
             return 0.0
         except Exception as e:
             logger.error(f"Error extracting engine size: {str(e)}")
             return 0.0
 
-    def extract_fuel_type(self, properties, title):
+    @staticmethod
+    def extract_fuel_type(properties, title):
         """Extract fuel type from properties or title"""
         try:
             # First try to get from properties
@@ -217,16 +369,17 @@ class TurboAzScraper:
             logger.error(f"Error extracting fuel type: {str(e)}")
             return None
 
-    def extract_seller_type(self, soup):
+    @staticmethod
+    def extract_seller_type(tree):
         """Extract seller type from the listing"""
         try:
             # Check for shop/dealer indicators
-            shop_contact = soup.select_one('div.shop-contact')
+            shop_contact = tree.css_first(_SHOP_CONTACT_CSS)
             if shop_contact:
                 return 'Dealer'
                 
             # Check for private seller indicators
-            seller_info = soup.select_one('div.product-owner__info')
+            seller_info = tree.css_first(_OWNER_INFO_CSS)
             if seller_info:
                 return 'Private'
                 
@@ -235,13 +388,14 @@ class TurboAzScraper:
             logger.error(f"Error extracting seller type: {str(e)}")
             return None
 
-    def extract_images(self, soup):
+    @staticmethod
+    def extract_images(tree):
         """Extract image URLs from the listing"""
         try:
-            image_elements = soup.select('div.product-photos__img img')
+            image_elements = tree.css(_IMAGES_CSS)
             images = []
             for img in image_elements:
-                src = img.get('src')
+                src = img.attributes.get('src')
                 if src:
                     images.append(src)
             return images if images else None
@@ -249,29 +403,31 @@ class TurboAzScraper:
             logger.error(f"Error extracting images: {str(e)}")
             return None
 
-    def extract_description(self, soup):
+    @staticmethod
+    def extract_description(tree):
         """Extract description safely"""
         try:
-            desc_elem = soup.select_one('div.product-description')
-            return desc_elem.get_text(strip=True) if desc_elem else None
+            desc_elem = tree.css_first(_DESCRIPTION_CSS)
+            return desc_elem.text(strip=True) if desc_elem else None
         except Exception as e:
             logger.error(f"Error extracting description: {str(e)}")
             return None
 
-    def process_car_data(self, soup, url):
+    @classmethod
+    def process_car_data(cls, tree, url) -> Optional[CarListing]:
         """Process and extract all car data from a listing page"""
         try:
             # Extract basic information
-            title_elem = soup.select_one('h1.product-title')
+            title_elem = tree.css_first(_TITLE_CSS)
             if not title_elem:
                 logger.error("Could not find title element")
                 return None
                 
-            title = title_elem.get_text(strip=True)
+            title = title_elem.text(strip=True)
             listing_id = url.split('/')[-1]
             
             # Extract properties
-            properties = self.parse_car_details(soup)
+            properties = cls.parse_car_details(tree)
             if not properties:
                 logger.error("No properties found")
                 return None
@@ -283,116 +439,165 @@ class TurboAzScraper:
                 year = 0
                 
             try:
-                mileage = float(properties.get('mileage', '0').replace(' ', '').replace('km', ''))
+                mileage = float(_NON_NUMBER_RE.sub('', properties.get('mileage', '')) or 0)
             except (ValueError, TypeError):
                 mileage = 0.0
 
-            # Build car data dictionary
-            car_data = {
-                'title': title,
-                'price': self.extract_price(soup),
-                'description': self.extract_description(soup),
-                'location': properties.get('location'),
-                'brand': properties.get('brand'),
-                'model': properties.get('model'),
-                'year': year,
-                'body_type': properties.get('body_type'),
-                'color': properties.get('color'),
-                'engine_size': self.extract_engine_size(properties),
-                'mileage': mileage,
-                'transmission': properties.get('transmission'),
-                'listing_id': listing_id,
-                'url': url,
-                'fuel_type': self.extract_fuel_type(properties, title),
-                'seller_type': self.extract_seller_type(soup),
-                'images': self.extract_images(soup)
-            }
+            # Build the car record
+            car_data = CarListing(
+                title=title,
+                price=cls.extract_price(tree),
+                description=cls.extract_description(tree),
+                location=properties.get('location'),
+                brand=properties.get('brand'),
+                model=properties.get('model'),
+                year=year,
+                body_type=properties.get('body_type'),
+                color=properties.get('color'),
+                engine_size=cls.extract_engine_size(properties),
+                mileage=mileage,
+                transmission=properties.get('transmission'),
+                listing_id=listing_id,
+                url=url,
+                fuel_type=cls.extract_fuel_type(properties, title),
+                seller_type=cls.extract_seller_type(tree),
+                images=cls.extract_images(tree)
+            )
             
             # Log the extracted data
-            logger.info(f"Extracted car data: {car_data}")
+            logger.debug("Extracted car data: %s", car_data)
             return car_data
             
         except Exception as e:
             logger.error(f"Error processing car data: {str(e)}")
             return None
 
-    def scrape_listing(self, listing_id: str) -> Dict[str, Any]:
+    async def scrape_listing(self, listing_id: str) -> Optional[CarListing]:
         """Scrape details from a specific car listing."""
         url = f"{self.config.base_url}/{listing_id}"
-        logger.info(f"Scraping listing: {url}")
+        logger.debug("Scraping listing: %s", url)
 
         try:
-            html = self.fetch_page(url)
+            html = await self.fetch_page(url, self.config.listing_cache_ttl)
             if not html:
                 logger.error(f"Failed to fetch page: {url}")
-                return {}
+                return None
 
-            soup = BeautifulSoup(html, 'lxml')
-            return self.process_car_data(soup, url)
+            # Parse in a worker process so parsing doesn't hold up the event loop
+            # and spreads across cores
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, _parse_listing_page, html, url)
         except Exception as e:
             logger.error(f"Error scraping listing {url}: {str(e)}")
-            return {}
+            return None
+
+    async def _safe_scrape(self, listing_id: str) -> Optional[CarListing]:
+        """
+        Scrape one listing, logging instead of raising on failure.
+
+        Args:
+            listing_id: The listing to scrape
+
+        Returns:
+            Optional[CarListing]: The car data, or None if scraping failed
+        """
+        try:
+            return await self.scrape_listing(listing_id)
+        except Exception as e:
+            logger.error(f"Error scraping listing {listing_id}: {str(e)}")
+            return None
 
-    def save_data(self) -> None:
-        """Save scraped data to database and CSV."""
+    async def save_data(self) -> None:
+        """Save the buffered cars from a worker thread so the event loop keeps serving requests."""
+        cars, self._cars_data = self._cars_data, []
+        loop = asyncio.get_running_loop()
         try:
-            if not self._cars_data:
+            await loop.run_in_executor(None, self._write_batch, cars, self._last_page_done)
+        except Exception:
+            # Put the batch back so the next save retries it; the checkpoint
+            # was not advanced, so a resumed run doesn't skip these pages either
+            self._cars_data[:0] = cars
+            raise
+
+    async def _wait_for_save(self) -> None:
+        """Wait for the background save started by the consumer, if one is running."""
+        task = self._save_task
+        if task:
+            # wait() leaves the save running if we are cancelled meanwhile, and the
+            # task stays recorded so the interrupted-run save still waits for it
+            await asyncio.wait({task})
+            self._save_task = None
+            if not task.cancelled():
+                task.result()  # Re-raise a failed save
+
+    async def _finish_saving(self) -> None:
+        """Let any background save complete, then save whatever is still buffered."""
+        await self._wait_for_save()
+        if self._cars_data:
+            await self.save_data()
+
+    def _write_batch(self, cars: List[CarListing], last_page_done: int) -> None:
+        """
+        Save scraped data to database and CSV.
+
+        Args:
+            cars: The batch to write
+            last_page_done: Last page whose listings are all in this or an earlier batch
+        """
+        try:
+            if not cars:
                 logger.warning("No data to save")
                 return
 
-            logger.info(f"Attempting to save {len(self._cars_data)} cars to database")
+            logger.info(f"Attempting to save {len(cars)} cars to database")
             
             # Create data directory if it doesn't exist
             data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
             os.makedirs(data_dir, exist_ok=True)
             
-            # Initialize database
-            init_db()
-            
-            # Save to database
-            saved_count = 0
-            for car_data in self._cars_data:
+            # Upsert the whole batch in one transaction instead of a commit per car
+            rows = []
+            for car_data in cars:
                 if not car_data:
                     continue
-                    
-                try:
-                    # Create Car instance
-                    car = Car(
-                        listing_id=car_data['listing_id'],
-                        title=car_data['title'],
-                        price=car_data['price'],
-                        description=car_data['description'],
-                        location=car_data['location'],
-                        brand=car_data['brand'],
-                        model=car_data['model'],
-                        year=car_data['year'],
-                        body_type=car_data['body_type'],
-                        color=car_data['color'],
-                        engine_size=car_data['engine_size'],
-                        mileage=car_data['mileage'],
-                        transmission=car_data['transmission'],
-                        url=car_data['url'],
-                        fuel_type=car_data['fuel_type'],
-                        seller_type=car_data['seller_type'],
-                        images=str(car_data['images']) if car_data['images'] else None
-                    )
-                    
-                    # Save to database
-                    save_car_to_db(car)
-                    saved_count += 1
-                    logger.info(f"Successfully saved car {car_data['listing_id']} to database")
-                except Exception as e:
-                    logger.error(f"Error saving car {car_data.get('listing_id', 'unknown')} to database: {str(e)}")
-                    continue
-            
+                row = {name: getattr(car_data, name) for name in _CAR_FIELDS}
+                row['images'] = str(row['images']) if row['images'] else None
+                rows.append(row)
+            try:
+                save_cars_to_db(rows)
+                saved_count = len(rows)
+            except Exception as e:
+                # e.g. one malformed row; save the batch row by row so the rest still land
+                logger.warning(f"Batch insert failed ({str(e)}), saving {len(rows)} cars individually")
+                saved_count = 0
+                for row in rows:
+                    try:
+                        save_car_to_db(Car(**row))
+                        saved_count += 1
+                    except Exception as e:
+                        logger.error(f"Error saving car {row['listing_id']} to database: {str(e)}")
             logger.info(f"Successfully saved {saved_count} cars to database")
             
-            # Save to CSV
+            # Append this batch to the run's CSV through a writer kept open for the whole run
             if saved_count > 0:
-                csv_file = os.path.join(data_dir, f'cars_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv')
-                df = pd.DataFrame(self._cars_data)
-                df.to_csv(csv_file, index=False, encoding='utf-8')
-                logger.info(f"Successfully saved data to CSV: {csv_file}")
+                if self._csv_writer is None:
+                    csv_file = os.path.join(data_dir, f'cars_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv')
+                    self._csv_fh = open(csv_file, 'w', newline='', encoding='utf-8', buffering=1 << 20)
+                    self._csv_writer = csv.writer(self._csv_fh)
+                    self._csv_writer.writerow(_CAR_FIELDS)
+                rows = [car_data for car_data in cars if car_data]
+                self._csv_writer.writerows([getattr(car, name) for name in _CAR_FIELDS] for car in rows)
+                # Flush before checkpointing so a resumed run never loses saved rows
+                self._csv_fh.flush()
+                logger.info(f"Successfully appended {len(rows)} rows to CSV: {self._csv_fh.name}")
+            
+            # Only batches that fully reached the database move the checkpoint, so
+            # an interrupted run never resumes past listings it failed to save
+            if saved_count < len(rows):
+                self._checkpoint_held = True
+                logger.warning(f"{len(rows) - saved_count} cars were not saved, keeping the previous checkpoint")
+            if not self._checkpoint_held:
+                self._save_state(last_page_done)
             
             logger.info("Data saving completed successfully")
             
@@ -400,52 +605,149 @@ class TurboAzScraper:
             logger.error(f"Error in save_data: {str(e)}")
             raise
 
-    def scrape(self) -> None:
-        """Main scraping function."""
+    def _load_state(self) -> int:
+        """
+        Restore the checkpoint of an interrupted run.
+
+        Returns:
+            int: The first page still to scrape (1 when there is nothing to resume)
+        """
+        try:
+            with open(self._state_file, encoding='utf-8') as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return 1
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable scrape state {self._state_file}: {str(e)}")
+            return 1
+
+        self._last_page_done = state.get('last_page_completed', 0)
+        logger.info(f"Resuming after page {self._last_page_done}")
+        return self._last_page_done + 1
+
+    def _save_state(self, last_page_done: int) -> None:
+        """Atomically write the resume checkpoint."""
+        state = {'last_page_completed': last_page_done}
+        tmp_file = f"{self._state_file}.tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        os.replace(tmp_file, self._state_file)
+
+    def _clear_state(self) -> None:
+        """Drop the checkpoint once a crawl has run to the end."""
+        with suppress(FileNotFoundError):
+            os.remove(self._state_file)
+
+    async def _produce_listing_ids(self, pages: asyncio.Queue, max_pages: Optional[int],
+                                   start_page: int = 1) -> None:
+        """
+        Fetch index pages in order and queue their listing IDs.
+
+        Pages are requested until two in a row come back empty (or repeat the
+        previous page, which is what the site serves past the end), so the
+        crawl never waits on a separate page-count request.
+
+        Args:
+            pages: Queue receiving (page_number, listing_ids); None marks the end
+            max_pages: Optional upper bound on the number of index pages
+            start_page: First page to fetch, past pages an earlier run completed
+        """
+        try:
+            empty_pages = 0
+            previous_ids: List[str] = []
+            for page in count(start_page):
+                if max_pages and page > max_pages:
+                    break
+                listing_ids = await self.get_listing_ids(page)
+                logger.info(f"Found {len(listing_ids)} listings on page {page}")
+                if not listing_ids or listing_ids == previous_ids:
+                    empty_pages += 1
+                    if empty_pages >= 2:
+                        logger.info(f"No more listings after page {page - empty_pages}")
+                        break
+                    continue
+                empty_pages = 0
+                previous_ids = listing_ids
+                await pages.put((page, listing_ids))
+        except Exception as e:
+            # End the crawl at the pages fetched so far rather than leaving the consumer waiting
+            logger.error(f"Error fetching listing pages: {str(e)}")
+        # Not sent on cancellation: the consumer has stopped by then, and a full
+        # queue would block this put forever
+        await pages.put(None)
+
+    async def _consume_listing_ids(self, pages: asyncio.Queue) -> None:
+        """
+        Scrape the listings of each queued page.
+
+        Args:
+            pages: Queue filled by _produce_listing_ids
+        """
+        while (item := await pages.get()) is not None:
+            page, listing_ids = item
+            logger.info(f"Scraping page {page}")
+            
+            # Skip listings already scraped from an earlier page (or twice on this one)
+            listing_ids = [lid for lid in dict.fromkeys(listing_ids) if lid not in self._seen_ids]
+            self._seen_ids.update(listing_ids)
+            
+            # Fetch the page's listings concurrently; the rate limiter paces them
+            results = await asyncio.gather(
+                *[self._safe_scrape(listing_id) for listing_id in listing_ids]
+            )
+            for listing_id, car_data in zip(listing_ids, results):
+                if car_data:
+                    self._cars_data.append(car_data)
+                    logger.debug("Successfully scraped car %s. Total cars: %d", listing_id, len(self._cars_data))
+            self._last_page_done = page
+            
+            # Save progress periodically, in the background so the next page's
+            # listings download while the batch is written
+            if len(self._cars_data) >= self.config.flush_batch:
+                await self._wait_for_save()
+                self._save_task = asyncio.create_task(self.save_data())
+                logger.info("Saving progress in the background")
+
+    async def scrape(self, max_pages: Optional[int] = None) -> None:
+        """
+        Main scraping function.
+
+        Args:
+            max_pages: Optional maximum number of pages to scrape
+        """
         try:
             logger.info("Starting scraping process")
             self._cars_data = []
+            start_page = self._load_state()
+            # Listings stored by earlier runs are fetched again only to refresh them
+            if not self.config.refresh_saved_listings:
+                self._seen_ids.update(get_saved_listing_ids())
             
-            total_pages = self.get_total_pages()
-            logger.info(f"Total pages to scrape: {total_pages}")
-            
-            for page in range(1, total_pages + 1):
-                logger.info(f"Scraping page {page}/{total_pages}")
-                
-                listing_ids = self.get_listing_ids(page)
-                logger.info(f"Found {len(listing_ids)} listings on page {page}")
-                
-                for listing_id in listing_ids:
-                    try:
-                        car_data = self.scrape_listing(listing_id)
-                        if car_data:
-                            self._cars_data.append(car_data)
-                            logger.info(f"Successfully scraped car {listing_id}. Total cars: {len(self._cars_data)}")
-                        sleep(self.config.delay)
-                    except Exception as e:
-                        logger.error(f"Error scraping listing {listing_id}: {str(e)}")
-                        continue
-                
-                # Save progress periodically
-                if len(self._cars_data) >= 20:  # Save every 20 cars
-                    self.save_data()
-                    self._cars_data = []  # Clear after saving
-                    logger.info("Saved progress and cleared buffer")
+            # Index pages are fetched ahead of the listing fan-out, so the next
+            # page's IDs are already in flight while this page's cars download
+            pages: asyncio.Queue = asyncio.Queue(maxsize=2)
+            producer = asyncio.create_task(self._produce_listing_ids(pages, max_pages, start_page))
+            try:
+                await self._consume_listing_ids(pages)
+            finally:
+                producer.cancel()
+                # Unlike awaiting the task, wait() doesn't turn the producer's own
+                # cancellation into ours, so cancelling scrape() still propagates
+                await asyncio.wait({producer})
             
             # Final save
-            if self._cars_data:
-                self.save_data()
-                logger.info("Scraping completed successfully")
+            await self._finish_saving()
+            logger.info("Scraping completed successfully")
+            
+            # The crawl reached the end, so the next run starts fresh
+            self._clear_state()
             
         except Exception as e:
             logger.error(f"Error in scrape: {str(e)}")
-            if self._cars_data:  # Try to save what we have
-                self.save_data()
+            await self._finish_saving()  # Try to save what we have
             raise
-        finally:
-            self.db.close()
 
-    def run(self, max_pages: Optional[int] = None) -> None:
+    async def run(self, max_pages: Optional[int] = None) -> None:
         """
         Run the scraper.
 
@@ -456,33 +758,41 @@ class TurboAzScraper:
             logger.info("Starting the car scraper")
             init_db()  # Initialize database tables
 
-            total_pages = self.get_total_pages()
-            if max_pages:
-                total_pages = min(total_pages, max_pages)
+            # Token bucket shared by every request: bursts go out at full speed
+            # and only requests beyond the configured rate wait
+            self.limiter = RateLimiter(self.config.concurrency, self.config.requests_per_second,
+                                       self.config.burst)
+            self.executor = ProcessPoolExecutor(max_workers=self.config.parse_workers)
 
-            logger.info(f"Will scrape {total_pages} pages")
+            logger.info(f"Will scrape up to {max_pages} pages" if max_pages else "Will scrape all pages")
 
-            self.scrape()
+            await self.scrape(max_pages)
 
             logger.info("Scraping completed successfully")
 
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, asyncio.CancelledError):
             logger.info("Scraping interrupted by user")
-            if self._cars_data:
-                self.save_data()
+            await self._finish_saving()
         except Exception as e:
             logger.critical(f"Unexpected error: {str(e)}")
-            if self._cars_data:
-                self.save_data()
+            await self._finish_saving()
             raise
-        finally:
-            self.db.close()
+
+
+def _parse_listing_page(html: str, url: str) -> Optional[CarListing]:
+    """Parse a listing page; module-level so worker processes can run it."""
+    return TurboAzScraper.process_car_data(LexborHTMLParser(html), url)
+
+
+async def _run_scraper() -> None:
+    """Run one scrape, releasing the scraper's resources however it ends."""
+    async with TurboAzScraper.create_scraper() as scraper:
+        await scraper.run(max_pages=DEFAULT_MAX_PAGES)
 
 
 def main():
     """Entry point of the script."""
-    scraper = TurboAzScraper.create_scraper()
-    scraper.run(max_pages=DEFAULT_MAX_PAGES)
+    asyncio.run(_run_scraper())
 
 
 if __name__ == '__main__':